@@ -0,0 +1,204 @@
+import numpy as np
+from collections import namedtuple
+
+##########################
+#### Global Variables ####
+##########################
+#mainly used by functions as initial conditions/constants
+
+#years will be by default -- 2021 to 2030 (defined in function)
+
+#For determining Energy -- increase in MWhr / year -- default 6.92*10**6 (defined in function)
+
+#### inital conditions for determining percentages ####
+#format for arrays is [<Coal>, <Natural Gas>, <Solar>, <Wind>, <Nuclear>, <Winter NG>]
+#constants are single precision, which is plenty for percentages and keeps every array downstream half the size
+initial_percentages = np.array([19.3, 53.6, 0.9, 17.5, 8.7, 0], dtype=np.float32)
+
+derivative_sources = np.array([-1.89, 0, 0.0976, 1.29, -0.116, 0], dtype=np.float32)
+#note - NG will be taken as slack in calculation, so value is NA
+#rate for winter NG is zero by default
+
+#sec_derivative_sources = all zeros by default (defined in function) i.e., np.zeros(6)
+
+#### values needed for reliability ####
+#reliability scores for each source based on 2021
+aRelScores = np.array([-9192.435233, -5811.753731, 26687.77778, -5368.914286, -8413.448276, 0], dtype=np.float32)
+
+#Percent Effectiveness of winterized NG -- 83.5 (defined as default in function)
+
+#construction costs per kW in USD
+const_costs = np.array([3500, 895, 2436, 1630, 5945, 899], dtype=np.float32)
+#kW increase in energy each year to calculate costs -- 789954.3379kW
+
+
+#To determine consumer costs --- (cents/kWh) per 1% source
+gen_costs = np.array([0.05230569948, 0.05229477612, 0.05233333333, 0.05228571429, 0.05229885057, 0.05229477612], dtype=np.float32)
+non_gen_costs = np.array([0.08514812774, 0.02177359266, 0.0592630969, 0.03965469949, 0.144630177, 0.02187004968], dtype=np.float32)
+#costs are linear in the percentages, so 56% generation + 44% non-generation is blended once here
+#gen_costs and non_gen_costs are treated as constants, if they are changed in place this has to be recomputed
+_consumer_blend = 0.56*gen_costs + 0.44*non_gen_costs
+
+
+#emissions in Million Metric Tons per 1% source per MWh
+source_emissions = np.array([1.0170164*10**-8, 1.008*10**-8, 0, 0, 0, 1.008*10**-8], dtype=np.float32)
+
+###################
+#### Functions ####
+###################
+#naming convention -- mix of underscore and camal case
+#array/matrix indicated by "a" followed by the the quantity in camal case
+
+#np.trapz was renamed to np.trapezoid in numpy 2.0
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+def get_aYear(start_year=2021, end_year=2030, size=1000):
+    '''returns an array for the time in years with default of 1000 samples'''
+    return np.linspace(start_year, end_year, size, dtype=np.float64)
+
+
+def get_aEnergy(aYear, dirE=6.92*10**6):
+    '''returns an array for the energy production each year, uses default slope from trendline'''
+    #use formula generate array, subtracting in place so only one array is allocated
+    aEnergy = np.multiply(aYear, dirE)
+    aEnergy -= 1.35*10**10
+    return aEnergy
+
+
+def get_aPercentSources(aYear, initial_percentages=initial_percentages, derivative_sources=derivative_sources, sec_derivative_sources=np.zeros(6, dtype=np.float32)):
+    '''returns a matrix for the percentages of the 6 sources (coal, NG, solar, wind, nuclear, winter NG), based on years and initial conditions
+    initial conditions are by default: 2nd derivative set to zero, inital percentages from 2019, 1st derivatives from linear trends'''
+    #single scenario is a batch of one
+    aPercentSources = get_aPercentSources_batched(aYear, np.asarray(initial_percentages)[None,:], np.asarray(derivative_sources)[None,:], np.asarray(sec_derivative_sources)[None,:])
+    return aPercentSources[0]
+
+
+def get_aPercentSources_batched(aYear, init_mat, d1_mat, d2_mat):
+    '''returns an (M, len(aYear), 6) array with the percentages of the 6 sources for M scenarios at once
+    each row of init_mat, d1_mat and d2_mat (shape (M,6)) holds the inital percentages, 1st and 2nd derivatives of one scenario
+    the result can be passed straight to get_all_metrics'''
+    aYear = np.asarray(aYear)
+    init_mat, d1_mat, d2_mat = np.asarray(init_mat), np.asarray(d1_mat), np.asarray(d2_mat)
+    #determine all scenarios and rows at once, t broadcasts as (1,N,1) against the (M,1,6) conditions
+    #polynomial is evaluated in nested (Horner) form, so t**2 is never built
+    #t takes the precision of the conditions, but only after the offset (absolute years would lose ~1e-4 yr in float32)
+    #float32 is the floor, integer conditions must not truncate the fractional years
+    t = (aYear-2021).astype(np.result_type(init_mat, d1_mat, d2_mat, np.float32))[None,:,None]
+    P = (0.5*d2_mat[:,None,:])*t
+    P += d1_mat[:,None,:]
+    P *= t
+    P += init_mat[:,None,:]
+
+    #set any percentages to zero if they have gone negative
+    #NG is clamped too, but it is overwritten as slack right after, so it doesn't matter
+    np.maximum(P, 0, out=P)
+
+    #determine NG perc. as slack
+    P[...,1] = 0
+    P[...,1] = 100 - P.sum(axis=-1)
+
+    #no samples (e.g. get_aYear(size=0)), so there is no 1st row to fall back on
+    if len(aYear) == 0:
+        return P
+
+    #if NG ends up being negative, that row takes the value of the last valid row of its scenario (i.e. keep P constant)
+    #an invalid 1st sample falls back to the inital percentages, which makes the 1st row always valid
+    valid = P[...,1] >= 0
+    P[:,0,:] = np.where(valid[:,:1], P[:,0,:], init_mat)
+    valid[:,0] = True
+    idx = np.maximum.accumulate(np.where(valid, np.arange(len(aYear)), 0), axis=1)
+    aPercentSources = np.take_along_axis(P, idx[:,:,None], axis=1)
+
+    #downstream metrics are matrix products over the rows, make sure each row is contiguous (no copy if it already is)
+    return np.ascontiguousarray(aPercentSources)
+        
+
+
+def _get_relScores(aRelScores, perc_effective):
+    '''returns a copy of the reliability scores with the winterized NG score set from the NG score and its effectiveness'''
+    rel_scores = aRelScores.copy() #copy so the module level (default) scores are never modified
+    rel_scores[5] = (1-perc_effective/100)*rel_scores[1]
+    return rel_scores
+
+def get_aReliability(aYear, aPercentSources, aEnergy, perc_effective=83.5, dirE=6.92*10**6, aRelScores=aRelScores):
+    '''returns array for the reliability score for a given set of years, energy production, and percent distribution of sources'''
+    Energy_2021 = dirE*2021 - 1.35*10**10 #determine annual energy for 2021 (needed later for calc)
+    #determine reliability score for winterized NG
+    rel_scores = _get_relScores(aRelScores, perc_effective)
+
+    #one matrix-vector product over all samples in aYear
+    aReliability = aPercentSources @ rel_scores
+
+    #scale by energy production relative to 2021, in place so no scale factor array is built
+    aReliability *= aEnergy
+    aReliability /= Energy_2021
+        
+    return aReliability
+
+def get_aConstructionCost(aYear, aPercentSources, const_costs=const_costs, rateE_kW=789954.3379):
+    '''returns an array for the annual construction cost based on years, percent source distribution, construction cost, and rate of increase in energy production'''
+    #percentages are turned into fractions by folding the /100 into the scalar, not by dividing the matrix
+    aConstructionCost = aPercentSources @ const_costs
+    aConstructionCost *= rateE_kW/100
+    
+    return aConstructionCost
+
+def _get_consumer_blend(gen, non_gen):
+    '''returns the blended consumer cost per 1% source, reusing the module level blend for the default costs'''
+    if gen is gen_costs and non_gen is non_gen_costs:
+        return _consumer_blend
+    return 0.56*np.asarray(gen) + 0.44*np.asarray(non_gen)
+
+def get_aConsumerCost(aYear, aPercentSources, gen_costs=gen_costs, non_gen_costs=non_gen_costs):
+    '''returns an array for the annual consumer cost based on years, percent sources, and generation/non-generation costs for each source'''
+    aConsumerCost = aPercentSources @ _get_consumer_blend(gen_costs, non_gen_costs)
+    
+    return aConsumerCost
+
+def get_aEmissions(aYear, aPercentSources, aEnergy, source_emissions=source_emissions):
+    '''returns an array for the total CO2 emissions based on years, percent sources, energy production, and emission data for each source'''
+    aEmissions = aPercentSources @ source_emissions
+    aEmissions *= aEnergy
+    
+    return aEmissions
+
+
+def _get_metric_coeffs(perc_effective, rel, const, rateE_kW, gen, non_gen, em, dtype):
+    '''returns the (4,6) matrix of per source coefficients (reliability, construction, consumer, emissions) used by get_all_metrics
+    the construction row already includes rateE_kW/100, so construction cost needs no scaling afterwards'''
+    #the construction row is built in the precision of the percentages, so rateE_kW/100 isn't rounded to float32 for float64 inputs
+    const = np.asarray(const)
+    const = const.astype(np.result_type(const, dtype))
+    return np.vstack([_get_relScores(rel, perc_effective), (rateE_kW/100)*const, _get_consumer_blend(gen, non_gen), em])
+
+#result of get_all_metrics, one array per quantity
+Metrics = namedtuple("Metrics", ["aEnergy", "aEmissions", "aReliability", "aConstructionCost", "aConsumerCost"])
+
+def get_all_metrics(aYear, aPercentSources, perc_effective=83.5, dirE=6.92*10**6, aRelScores=aRelScores, const_costs=const_costs, rateE_kW=789954.3379, gen_costs=gen_costs, non_gen_costs=non_gen_costs, source_emissions=source_emissions):
+    '''returns energy, emissions, reliability, construction cost and consumer cost together as a Metrics tuple
+    same results as the separate get_a* functions, but aPercentSources is only read once for all four products
+    aPercentSources may also be a stack of scenarios with shape (..., len(aYear), 6), the other metrics then have shape (..., len(aYear)) while aEnergy stays 1D'''
+    aEnergy = get_aEnergy(aYear, dirE)
+    Energy_2021 = dirE*2021 - 1.35*10**10 #determine annual energy for 2021 (needed for reliability)
+
+    #stack the per source coefficients as rows, one product gives a (4,N) matrix with a contiguous row per metric
+    coeffs = _get_metric_coeffs(perc_effective, aRelScores, const_costs, rateE_kW, gen_costs, non_gen_costs, source_emissions, aPercentSources.dtype)
+    #any scenario axes are flattened into the sample axis, so it stays a single BLAS call (multithreaded for large inputs)
+    shape = aPercentSources.shape[:-1]
+    aMetrics = coeffs @ aPercentSources.reshape(-1, 6).T
+    aReliability, aConstructionCost, aConsumerCost, aEmissions = aMetrics.reshape((4,) + shape)
+
+    #scale the energy dependent rows in place
+    aReliability *= aEnergy
+    aReliability /= Energy_2021
+    aEmissions *= aEnergy
+
+    return Metrics(aEnergy, aEmissions, aReliability, aConstructionCost, aConsumerCost)
+
+
+def get_totalEmissions(aYear, aEmissions):
+    '''returns the net emissions from the arrays for annual emissions and the time in years'''
+    #trapezoidal rule, same cost as summing the samples but second order accurate
+    net_em = _trapezoid(aEmissions, aYear)
+    return net_em
\ No newline at end of file
@@ -0,0 +1,88 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from compute import initial_percentages, derivative_sources, get_aYear, get_aPercentSources, get_all_metrics, get_totalEmissions
+
+#plots for the calculations in compute.py, kept separate so importing compute never pulls in matplotlib
+
+if __name__ == "__main__":
+    #calculations
+    #trying different initial conditions
+    sec_der_sources = np.array([-0.5, 0, 1, -0.001, -1, 0.1])
+
+    Years = get_aYear(2021, 2030)
+    PercSources = get_aPercentSources(Years, sec_derivative_sources=sec_der_sources)
+
+    #single precision default constants should follow the double precision trajectories closely
+    PercSources32 = get_aPercentSources(Years)
+    PercSources64 = get_aPercentSources(Years, initial_percentages.astype(np.float64), derivative_sources.astype(np.float64), np.zeros(6))
+    np.testing.assert_allclose(PercSources32, PercSources64, rtol=1e-5, atol=1e-4)
+
+    #integer conditions still follow a smooth trajectory (fractional years are kept)
+    YearsInt = get_aYear(size=7)
+    PercSourcesInt = get_aPercentSources(YearsInt, np.array([20, 50, 0, 20, 10, 0]), np.array([-2, 0, 0, 1, 0, 0]), np.zeros(6, dtype=int))
+    np.testing.assert_allclose(PercSourcesInt[:,0], 20 - 2*(YearsInt-2021), rtol=1e-6)
+    
+    Energy, Emissions, Rel, ConstCost, ConsmCost = get_all_metrics(Years, PercSources)
+
+    #PLOTS will have 6 figures
+    #Fig 1 -- Energy
+    #Fig 2 -- CO2
+    #Fig 3 -- % Production
+    #Fig 4 -- Reliability
+    #Fig 5 -- Construction Cost
+    #Fig 6 -- Consumer Cost
+    
+    #plot energy
+    plt.figure(0)
+    plt.plot(Years, Energy)
+    plt.xlabel("Years")
+    plt.ylabel("Energy Production MWhr")
+    plt.title("Annual Energy Production")
+    
+    #plot CO2
+    plt.figure(1)
+    plt.plot(Years, Emissions)
+    plt.xlabel("Years")
+    plt.ylabel("CO2 Emissions (Million Metric Tons)")
+    plt.title("Annual Carbon Emissions")
+    print("Total Emissions: ", get_totalEmissions(Years, Emissions))
+
+    #plot the percentages
+    plt.figure(2)
+    PercCoal = PercSources[:,0]
+    PercNG = PercSources[:,1]
+    PercSolar = PercSources[:,2]
+    PercWind = PercSources[:,3]
+    PercNuclear = PercSources[:,4]
+    PercWinterNG = PercSources[:,5]
+
+    plt.plot(Years, PercCoal, "k", Years, PercNG, "r", Years, PercSolar, "y", Years, PercWind, "b", Years, PercNuclear, "g", Years, PercWinterNG, "m")
+    plt.xlabel("Years")
+    plt.ylabel("% Source By Energy Production")
+    plt.title("Percent Distribution of Sources Over Time")
+    plt.legend(["Coal", "NG", "Solar", "Wind", "Nuclear", "Winterized NG"])
+
+    #plot reliability
+    plt.figure(3)
+    plt.plot(Years, Rel)
+    plt.xlabel("Years")
+    plt.ylabel("Reliability (expected reduction in MWh)")
+    plt.title("Reliability Over Time")
+
+    
+    #plot consutrction cost
+    plt.figure(4)
+    plt.plot(Years, ConstCost)
+    plt.xlabel("Years")
+    plt.ylabel("Cost (USD)")
+    plt.title("Annual Construction Costs")
+
+
+    #plot consumer cost
+    plt.figure(5)
+    plt.plot(Years, ConsmCost)
+    plt.xlabel("Years")
+    plt.ylabel("Cost (cents/kWh)")
+    plt.title("Annual Consumer Costs")
+    
+    plt.show()
\ No newline at end of file